@@ -1,23 +1,62 @@
-from flask import Flask, request, jsonify, send_from_directory
+from flask import Flask, request, jsonify, make_response, send_from_directory, stream_with_context
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import func, select
+from flask_caching import Cache
 from flask_cors import CORS
 from flask_mail import Mail, Message
 from werkzeug.utils import secure_filename
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
 from dotenv import load_dotenv
+from celery import Celery
+from upload_parser import LargeUploadRequest
+from gevent import get_hub, monkey
 import os
-import random
+import io
+import functools
+import hashlib
+import hmac
+import itertools
+import secrets
+import time
+import redis
 from datetime import datetime
+from urllib.parse import unquote
 import json
+import orjson
 import cloudinary
 import cloudinary.uploader
 import cloudinary.api
+import cloudinary.utils
 import smtplib
 from email.message import EmailMessage
 
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson for request parsing and jsonify.
+
+    Dates are passed through to Flask's default handler so responses keep
+    the same RFC 822 format and sorted keys as the stdlib provider.
+    """
+    option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_SORT_KEYS
+
+    def dumpb(self, obj, indent=False):
+        """Serializes straight to bytes, for building responses without a str round trip."""
+        option = (self.option | orjson.OPT_INDENT_2) if indent else self.option
+        return orjson.dumps(obj, default=self.default, option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self.dumpb(obj, indent=bool(kwargs.get('indent'))).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
+app.request_class = LargeUploadRequest
+app.json = ORJSONProvider(app)
 CORS(app) 
 
 load_dotenv()
@@ -35,8 +74,17 @@ if database_url and database_url.startswith("postgres://"):
 
 app.config['SQLALCHEMY_DATABASE_URI'] = database_url
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
-app.config['UPLOAD_FOLDER'] = 'uploads'
+# Each gunicorn worker (and Celery worker process) holds its own pool, so
+# workers * (pool_size + max_overflow) must stay under Postgres'
+# max_connections (100 by default). Greenlets beyond that wait for a connection.
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_pre_ping': True,
+    'pool_size': int(os.getenv("DB_POOL_SIZE", 5)),
+    'max_overflow': int(os.getenv("DB_MAX_OVERFLOW", 5))
+}
 app.config['MAX_CONTENT_LENGTH'] = 100 * 1024 * 1024 
+# Largest non-file form field; also caps the multipart parser's buffer
+app.config['MAX_FORM_MEMORY_SIZE'] = 2 * 1024 * 1024
 app.config['MAIL_SERVER'] = os.getenv("MAIL_SERVER")
 app.config['MAIL_PORT'] = int(os.getenv("MAIL_PORT",465))
 app.config['MAIL_USE_TLS'] = False  
@@ -44,27 +92,150 @@ app.config['MAIL_USE_SSL'] = True
 app.config['MAIL_USERNAME'] = os.environ.get("MAIL_USERNAME")
 app.config['MAIL_PASSWORD'] = os.getenv("MAIL_PASSWORD")
 app.config['MAIL_DEFAULT_SENDER'] = os.getenv("MAIL_USERNAME")
+app.config['REDIS_URL'] = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+app.config['CELERY_BROKER_URL'] = os.getenv("CELERY_BROKER_URL", app.config['REDIS_URL'])
+app.config['OTP_TTL_SECONDS'] = 300
+app.config['CACHE_TYPE'] = 'RedisCache'
+app.config['CACHE_REDIS_URL'] = app.config['REDIS_URL']
+# Staged upload bytes live in their own database so they can't crowd out the broker, cache or OTPs
+app.config['UPLOAD_STAGING_REDIS_URL'] = os.getenv("UPLOAD_STAGING_REDIS_URL", "redis://localhost:6379/1")
+app.config['STATUS_CACHE_SECONDS'] = 30
+
+# Config values read on hot paths, resolved once at import
+_MAIL_SENDER = app.config['MAIL_USERNAME']
+_OTP_TTL_SECONDS = app.config['OTP_TTL_SECONDS']
 
 
 mail = Mail(app)
 db = SQLAlchemy(app)
+cache = Cache(app)
 
-# --- IN-MEMORY OTP STORAGE ---
-# Stores email -> OTP mapping. Example: {'user@test.com': '123456'}
-otp_storage = {}
-if not os.path.exists(app.config['UPLOAD_FOLDER']):
-    os.makedirs(app.config['UPLOAD_FOLDER'])
+# Flag lazy-load N+1 queries while developing (requirements-dev.txt).
+# app.debug isn't set yet at import, so check the dev entry points directly:
+# `python app.py` or FLASK_DEBUG=1.
+if __name__ == '__main__' or os.getenv("FLASK_DEBUG", "").lower() in ("1", "true"):
+    try:
+        from nplusone.ext.flask_sqlalchemy import NPlusOne
+        NPlusOne(app)
+    except ImportError:
+        pass
+
+# --- BACKGROUND TASKS ---
+# Run workers separately: celery -A app.celery worker -Q celery,cloudinary_uploads
+celery = Celery(app.import_name, broker=app.config['CELERY_BROKER_URL'])
+celery.conf.update(task_ignore_result=True)
+
+# Placeholders stored in file columns until the upload task fills in the URL,
+# or after it has given up
+PENDING_UPLOAD = 'pending'
+FAILED_UPLOAD = 'failed'
+# Staged upload bytes are kept in Redis at most this long
+UPLOAD_STAGING_TTL_SECONDS = 24 * 60 * 60
+
+# Cloudinary rejects chunks under 5MB (except the last one)
+CLOUDINARY_CHUNK_SIZE = 6_000_000
+STREAM_READ_SIZE = 1024 * 1024
+CLOUDINARY_URL_PREFIX = f"https://res.cloudinary.com/{os.getenv('CLOUDINARY_CLOUD_NAME')}/"
+# Upload kinds accepted by /api/registration/file -> Cloudinary folder
+REGISTRATION_FILE_FOLDERS = {
+    'bonafide': 'hackathon_bonafide',
+    'ppt': 'hackathon_ppt'
+}
+
+# Rows fetched from the DB per round trip when streaming the admin listing,
+# and the largest page a client may ask for with ?limit=
+ADMIN_STREAM_BATCH_SIZE = 200
+ADMIN_PAGE_MAX_SIZE = 500
+
+# --- OTP STORAGE (REDIS) ---
+# Stores otp:<email> -> OTP with a TTL so every worker sees the same codes
+# and expired ones clean themselves up. Example: 'otp:user@test.com' -> '123456'
+redis_client = redis.Redis.from_url(app.config['REDIS_URL'], decode_responses=True)
+# Raw bytes client for staging uploaded files between the web and worker processes
+blob_client = redis.Redis.from_url(app.config['UPLOAD_STAGING_REDIS_URL'])
+
+def store_otp(email, otp):
+    redis_client.setex(f"otp:{email}", _OTP_TTL_SECONDS, otp)
+
+def pop_otp(email):
+    """Atomically fetches and deletes the OTP for an email, so it can only be used once."""
+    pipe = redis_client.pipeline()
+    pipe.get(f"otp:{email}")
+    pipe.delete(f"otp:{email}")
+    stored_otp, _ = pipe.execute()
+    return stored_otp
+
+def otp_matches(stored_otp, user_otp):
+    """Constant-time OTP comparison so response timing doesn't leak matching digits."""
+    if not stored_otp or user_otp is None:
+        return False
+    return hmac.compare_digest(stored_otp.encode(), str(user_otp).encode())
 
 # --- HELPER ---
-def upload_to_cloudinary(file_obj, folder_name="confluence_uploads"):
+# Argon2id with an explicit, modest cost (OWASP minimum) to keep signin fast
+password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
+
+def run_cpu_bound(func, *args):
+    """Runs blocking CPU work (password hashing) without stalling the worker.
+
+    Under gunicorn's gevent workers a hash computed on the hub blocks every
+    other greenlet, so it goes to gevent's native thread pool instead; argon2
+    and hashlib.scrypt release the GIL while they run. Called directly otherwise.
+    """
+    if monkey.is_module_patched('threading'):
+        return get_hub().threadpool.apply(func, args)
+    return func(*args)
+
+def _argon2_matches(stored_hash, password):
+    try:
+        return password_hasher.verify(stored_hash, password)
+    except (VerificationError, InvalidHashError):
+        return False
+
+def hash_password(password):
+    return run_cpu_bound(password_hasher.hash, password)
+
+# Verified against when the user doesn't exist, so unknown emails take as
+# long to reject as wrong passwords
+_DUMMY_HASH = hash_password(secrets.token_hex(16))
+
+def verify_password(user, password):
+    """Checks a password, upgrading legacy Werkzeug scrypt hashes to Argon2 on success.
+
+    Pass user=None for an unknown email: the hash work is still done and False
+    is returned, so response timing doesn't reveal which emails are registered.
+    """
+    if user is None:
+        run_cpu_bound(_argon2_matches, _DUMMY_HASH, password)
+        return False
+
+    if not user.password.startswith('$argon2'):
+        if not run_cpu_bound(check_password_hash, user.password, password):
+            return False
+        user.password = hash_password(password)
+        db.session.commit()
+        return True
+
+    if not run_cpu_bound(_argon2_matches, user.password, password):
+        return False
+    if password_hasher.check_needs_rehash(user.password):
+        user.password = hash_password(password)
+        db.session.commit()
+    return True
+
+def upload_to_cloudinary(file_obj, folder_name="confluence_uploads", filename=None):
     if not file_obj:
         return None
     try:
         # 1. Get the original filename (e.g., "my_file.pdf")
-        filename = secure_filename(file_obj.filename)
+        filename = secure_filename(filename or file_obj.filename)
         
-        response = cloudinary.uploader.upload(
-            file_obj, 
+        # upload_large sends the file in chunks straight from its stream
+        # instead of reading the whole thing into memory first
+        response = cloudinary.uploader.upload_large(
+            getattr(file_obj, 'stream', file_obj),
+            chunk_size=CLOUDINARY_CHUNK_SIZE,
+            filename=filename,
             folder=folder_name,
             resource_type="raw",    # <--- KEY CHANGE: Force RAW mode
             public_id=filename,     # We provide the name with extension
@@ -78,24 +249,169 @@ def upload_to_cloudinary(file_obj, folder_name="confluence_uploads"):
         print(f"Cloudinary Error: {e}")
         return None
 
-def save_file(file_obj):
-    if file_obj and file_obj.filename != '':
-        filename = secure_filename(file_obj.filename)
-        unique_name = f"{int(datetime.utcnow().timestamp())}_{filename}"
-        file_path = os.path.join(app.config['UPLOAD_FOLDER'], unique_name)
-        file_obj.save(file_path)
-        return unique_name
-    return None
-
-def serialize_model(model_instance):
-    """Converts a SQLAlchemy model instance into a dictionary."""
-    if not model_instance:
+def etagged(view):
+    """Adds an ETag from the response body and answers a matching If-None-Match with 304."""
+    @functools.wraps(view)
+    def wrapper(*args, **kwargs):
+        response = make_response(view(*args, **kwargs))
+        response.add_etag()
+        return response.make_conditional(request)
+    return wrapper
+
+def status_cache_key():
+    return f"status:{request.view_args['user_id']}"
+
+def _read_chunk(stream, size):
+    """Reads up to `size` bytes from a non-seekable stream, STREAM_READ_SIZE at a time."""
+    chunk = bytearray()
+    while len(chunk) < size:
+        data = stream.read(min(STREAM_READ_SIZE, size - len(chunk)))
+        if not data:
+            break
+        chunk += data
+    return bytes(chunk)
+
+def stream_to_cloudinary(stream, total_size, folder_name, filename):
+    """Uploads a raw request body to Cloudinary in chunks as it is read.
+
+    upload_large needs a seekable file to size it, so the chunked upload is
+    driven here with the size taken from the Content-Length header.
+    """
+    try:
+        filename = secure_filename(filename)
+        upload_id = cloudinary.utils.random_public_id()
+        options = dict(
+            folder=folder_name,
+            resource_type="raw",
+            public_id=filename,
+            use_filename=True,
+            unique_filename=False,
+            overwrite=True
+        )
+        response = None
+        offset = 0
+        chunk = _read_chunk(stream, CLOUDINARY_CHUNK_SIZE)
+        while chunk:
+            headers = {
+                "Content-Range": f"bytes {offset}-{offset + len(chunk) - 1}/{total_size}",
+                "X-Unique-Upload-Id": upload_id
+            }
+            response = cloudinary.uploader.upload_large_part((filename, chunk), http_headers=headers, **options)
+            offset += len(chunk)
+            chunk = _read_chunk(stream, CLOUDINARY_CHUNK_SIZE)
+
+        if response is None or offset != total_size:
+            return None
+        print(response)
+        return response.get('secure_url')
+    except Exception as e:
+        print(f"Cloudinary Error: {e}")
         return None
-    data = {}
-    for column in model_instance.__table__.columns:
-        data[column.name] = getattr(model_instance, column.name)
-    return data
+
+def is_cloudinary_url(url):
+    """Checks that a client-supplied file URL points at our Cloudinary account."""
+    return isinstance(url, str) and url.startswith(CLOUDINARY_URL_PREFIX)
+
+def stage_upload(file_obj):
+    """Copies an uploaded file into Redis so whichever worker runs the upload task can read it.
+
+    The web and worker processes don't share a filesystem on every platform,
+    so the bytes go through Redis rather than local disk. Returns the key.
+    """
+    key = f"upload:{secrets.token_hex(16)}"
+    blob_client.set(key, b'', ex=UPLOAD_STAGING_TTL_SECONDS)
+    for chunk in iter(lambda: file_obj.stream.read(STREAM_READ_SIZE), b''):
+        blob_client.append(key, chunk)
+    return key
+
+class StagedUpload(io.RawIOBase):
+    """Seekable, read-only view of a staged upload that fetches byte ranges from Redis.
+
+    upload_large seeks to the end to learn the size and then reads one
+    CLOUDINARY_CHUNK_SIZE piece at a time, so only one chunk is held in memory.
+    """
+    def __init__(self, key):
+        super().__init__()
+        if not blob_client.exists(key):
+            raise RuntimeError(f"Staged upload {key} has expired")
+        self.key = key
+        self.size = blob_client.strlen(key)
+        self.position = 0
+
+    def readable(self):
+        return True
+
+    def seekable(self):
+        return True
+
+    def tell(self):
+        return self.position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        base = {io.SEEK_SET: 0, io.SEEK_CUR: self.position, io.SEEK_END: self.size}[whence]
+        self.position = max(base + offset, 0)
+        return self.position
+
+    def readinto(self, buffer):
+        end = min(self.position + len(buffer), self.size)
+        if end <= self.position:
+            return 0
+        data = blob_client.getrange(self.key, self.position, end - 1)
+        buffer[:len(data)] = data
+        self.position += len(data)
+        return len(data)
+
+def serialize_model(row):
+    """Converts a Core result row (e.g. from select(Model.__table__)) into a dictionary."""
+    if not row:
+        return None
+    return dict(row._mapping)
+
+@celery.task
+def send_email_task(subject, recipients, body, sender):
+    """Sends an email from a Celery worker so request handlers don't block on SMTP."""
+    with app.app_context():
+        msg = Message(subject, sender=sender, recipients=recipients)
+        msg.body = body
+        mail.send(msg)
+
+class UploadFilesTask(celery.Task):
+    def on_failure(self, exc, task_id, args, kwargs, einfo):
+        # Out of retries (or the staged bytes are gone): mark the files as
+        # failed instead of leaving the row pending forever
+        registration_pk, uploads = args
+        with app.app_context():
+            db.session.query(HackathonRegistration).filter_by(id=registration_pk).update(
+                {column: FAILED_UPLOAD for column in uploads}
+            )
+            db.session.commit()
+        blob_client.delete(*(key for key, _, _ in uploads.values()))
+
+@celery.task(bind=True, base=UploadFilesTask, queue='cloudinary_uploads', max_retries=3, default_retry_delay=30)
+def upload_files_task(self, registration_pk, uploads):
+    """Uploads staged registration files to Cloudinary and stores their URLs on the row.
+
+    `uploads` maps a column name to a (staging key, original name, folder) triple.
+    """
+    with app.app_context():
+        urls = {}
+        for column, (key, original_name, folder) in uploads.items():
+            urls[column] = upload_to_cloudinary(StagedUpload(key), folder, filename=original_name)
+
+        if None in urls.values():
+            raise self.retry()
+
+        db.session.query(HackathonRegistration).filter_by(id=registration_pk).update(urls)
+        db.session.commit()
+
+        blob_client.delete(*(key for key, _, _ in uploads.values()))
+
 # --- MODELS ---
+# Backs HackathonRegistration.registration_id; created by db.create_all() for
+# new databases and by the upgrade-db command for existing ones
+hack_reg_seq = db.Sequence('hack_reg_seq', metadata=db.metadata)
+REGISTRATION_ID_DEFAULT = "('HACK' || lpad(nextval('hack_reg_seq')::text, 5, '0'))"
+
 class User(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     email = db.Column(db.String(120), unique=True, nullable=False)
@@ -104,11 +420,21 @@ class User(db.Model):
 
 class HackathonRegistration(db.Model):
     __tablename__ = 'hackathon_registrations'
+    __table_args__ = (
+        db.Index('ix_hackreg_submitted_at', 'submitted_at'),
+    )
+    # Fetch server-generated columns via RETURNING during the INSERT
+    __mapper_args__ = {'eager_defaults': True}
     id = db.Column(db.Integer, primary_key=True)
     # Optional: link to logged-in user
-    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True)
-    # Public registration ID like HACK0001
-    registration_id = db.Column(db.String(20), unique=True, index=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=True, index=True)
+    # Public registration ID like HACK00001, generated by Postgres on insert
+    registration_id = db.Column(
+        db.String(20),
+        unique=True,
+        index=True,
+        server_default=db.text(REGISTRATION_ID_DEFAULT)
+    )
     # ----------------------------
     # Team Information
     # ----------------------------
@@ -138,6 +464,68 @@ class HackathonRegistration(db.Model):
     # ----------------------------
     submitted_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+def upgrade_registration_ids():
+    """Adds hack_reg_seq and the registration_id default to tables created before them.
+
+    create_all() leaves existing tables alone, so without this new rows get a
+    NULL registration_id. Run once per deploy through `flask --app app upgrade-db`,
+    never from request or worker startup. The table is locked against inserts
+    while the sequence is moved past every number already handed out (old IDs
+    were HACK + zero-padded id); it is never moved backwards, and an empty
+    table leaves it to start at 1. Rows left without an ID are backfilled.
+    """
+    if db.engine.dialect.name != 'postgresql':
+        return
+    with db.engine.begin() as conn:
+        conn.execute(db.text("CREATE SEQUENCE IF NOT EXISTS hack_reg_seq"))
+        conn.execute(db.text("LOCK TABLE hackathon_registrations IN SHARE ROW EXCLUSIVE MODE"))
+
+        column_default = conn.execute(db.text(
+            "SELECT column_default FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = 'hackathon_registrations' "
+            "AND column_name = 'registration_id'"
+        )).scalar()
+        if column_default is None:
+            conn.execute(db.text(
+                "ALTER TABLE hackathon_registrations "
+                f"ALTER COLUMN registration_id SET DEFAULT {REGISTRATION_ID_DEFAULT}"
+            ))
+
+        conn.execute(db.text(
+            "SELECT setval('hack_reg_seq', t.target, true) "
+            "FROM (SELECT GREATEST("
+            "COALESCE(MAX(id), 0), "
+            "COALESCE(MAX(CASE WHEN registration_id ~ '^HACK[0-9]+$' "
+            "THEN substring(registration_id FROM 5)::bigint END), 0)"
+            ") AS target FROM hackathon_registrations) t, hack_reg_seq s "
+            "WHERE t.target > 0 "
+            "AND t.target >= CASE WHEN s.is_called THEN s.last_value + 1 ELSE s.last_value END"
+        ))
+        conn.execute(db.text(
+            "UPDATE hackathon_registrations SET registration_id = DEFAULT "
+            "WHERE registration_id IS NULL"
+        ))
+
+def upgrade_indexes():
+    """Creates indexes added after the tables were first created; create_all() skips them."""
+    with db.engine.begin() as conn:
+        conn.execute(db.text(
+            "CREATE INDEX IF NOT EXISTS ix_hackathon_registrations_user_id "
+            "ON hackathon_registrations (user_id)"
+        ))
+        conn.execute(db.text(
+            "CREATE INDEX IF NOT EXISTS ix_hackreg_submitted_at "
+            "ON hackathon_registrations (submitted_at)"
+        ))
+
+@app.cli.command('upgrade-db')
+def upgrade_db_command():
+    """Brings an existing database up to the current schema (run once per deploy)."""
+    db.create_all()
+    upgrade_indexes()
+    upgrade_registration_ids()
+    print("Database upgraded")
+
 with app.app_context():
     db.create_all()
 
@@ -151,7 +539,6 @@ def setup_db():
 
 @app.route('/api/send-otp', methods=['POST', 'OPTIONS'])
 def send_otp():
-    print(app.config['MAIL_USERNAME'],os.environ.get("MAIL_USERNAME"), "sddad")
     try:
         print("JSON RECEIVED:", request.json)
 
@@ -171,16 +558,15 @@ def send_otp():
             if not existing_user:
                 return jsonify({'message': 'No account found with this email'}), 404
 
-        otp = str(random.randint(100000, 999999))
-        otp_storage[email] = otp
+        otp = f"{secrets.randbelow(900000) + 100000:06d}"
+        store_otp(email, otp)
 
-        msg = Message(
+        send_email_task.delay(
             'Your Verification OTP',
-            sender=app.config['MAIL_USERNAME'],
-            recipients=[email]
+            [email],
+            f"Your OTP is: {otp}",
+            _MAIL_SENDER
         )
-        msg.body = f"Your OTP is: {otp}"
-        mail.send(msg)
 
         return jsonify({'message': 'OTP sent successfully'}), 200
 
@@ -200,8 +586,9 @@ def reset_password():
     otp = data.get('otp')
     new_password = data.get('newPassword')
 
-    # 1. Verify OTP
-    if email not in otp_storage or otp_storage[email] != otp:
+    # 1. Verify OTP (consumed whether or not it matches)
+    stored_otp = pop_otp(email)
+    if not otp_matches(stored_otp, otp):
         return jsonify({'message': 'Invalid or expired OTP'}), 400
 
     # 2. Find User
@@ -211,12 +598,9 @@ def reset_password():
 
     try:
         # 3. Update Password (FIXED VARIABLE NAME)
-        user.password = generate_password_hash(new_password)
+        user.password = hash_password(new_password)
         db.session.commit()
         
-        # 4. Clear OTP
-        del otp_storage[email]
-        
         return jsonify({'message': 'Password reset successfully'}), 200
     except Exception as e:
         db.session.rollback()
@@ -230,23 +614,20 @@ def signup():
     user_otp = data.get('otp')
     password = data.get('password')
 
-    # Verify OTP
-    stored_otp = otp_storage.get(email)
-    if not stored_otp or stored_otp != user_otp:
+    # Verify OTP (consumed whether or not it matches)
+    stored_otp = pop_otp(email)
+    if not otp_matches(stored_otp, user_otp):
         return jsonify({"message": "Invalid or Incorrect OTP"}), 400
 
     # Create User
     if User.query.filter_by(email=email).first():
         return jsonify({"message": "User already exists"}), 400
 
-    hashed_password = generate_password_hash(password, method='scrypt')
+    hashed_password = hash_password(password)
     new_user = User(email=email, password=hashed_password)
     
     db.session.add(new_user)
     db.session.commit()
-    
-    # Clean up OTP
-    del otp_storage[email]
 
     return jsonify({"message": "Registration Successful!", "user_id": new_user.id}), 201
 
@@ -254,11 +635,13 @@ def signup():
 def signin():
     data = request.json
     user = User.query.filter_by(email=data['email']).first()
-    if user and check_password_hash(user.password, data['password']):
+    if verify_password(user, data['password']):
         return jsonify({"message": "Login success", "user_id": user.id, "email": user.email})
     return jsonify({"message": "Invalid email or password"}), 401
 
 @app.route('/api/status/<int:user_id>', methods=['GET'])
+@etagged
+@cache.cached(timeout=app.config['STATUS_CACHE_SECONDS'], key_prefix=status_cache_key)
 def get_status(user_id):
     idea = HackathonRegistration.query.filter_by(user_id=user_id).first()
     
@@ -267,30 +650,90 @@ def get_status(user_id):
         "ideaPitching": idea.registration_id if idea else None
     })
 
+@app.route('/api/upload-signature', methods=['GET'])
+def upload_signature():
+    # Signs a direct browser -> Cloudinary upload so the file never passes
+    # through this server; the returned secure_url goes to /api/registration
+    folder_name = REGISTRATION_FILE_FOLDERS.get(request.args.get('kind'))
+    if not folder_name:
+        return jsonify({"message": "A valid kind is required"}), 400
+
+    config = cloudinary.config()
+    params = {"timestamp": int(time.time()), "folder": folder_name}
+    signature = cloudinary.utils.api_sign_request(params, config.api_secret)
+
+    return jsonify({
+        "signature": signature,
+        "timestamp": params["timestamp"],
+        "folder": folder_name,
+        "apiKey": config.api_key,
+        "uploadUrl": f"https://api.cloudinary.com/v1_1/{config.cloud_name}/raw/upload"
+    })
+
+@app.route('/api/registration/file', methods=['POST'])
+def upload_registration_file():
+    # Raw file body, no multipart: ?kind=bonafide|ppt plus an X-Filename header
+    filename = unquote(request.headers.get('X-Filename', ''))
+    folder_name = REGISTRATION_FILE_FOLDERS.get(request.args.get('kind'))
+
+    if not filename or not folder_name:
+        return jsonify({"message": "X-Filename header and a valid kind are required"}), 400
+    if not request.content_length:
+        return jsonify({"message": "Content-Length is required"}), 411
+
+    url = stream_to_cloudinary(request.stream, request.content_length, folder_name, filename)
+    if not url:
+        return jsonify({"message": "File upload failed"}), 500
+
+    return jsonify({"url": url}), 201
+
 @app.route('/api/registration', methods=['POST'])
 def hackathon_registration():
     try:
         # ----------------------------
         # Optional user (if logged in)
         # ----------------------------
-        user_id = request.form.get('userId')  # can be None
+        # Multipart form with the files attached, or JSON with the URLs of
+        # files already uploaded through /api/registration/file or
+        # directly to Cloudinary with /api/upload-signature
+        form = request.get_json(silent=True) if request.is_json else request.form
+        if not isinstance(form, dict):
+            return jsonify({"message": "Request body must be a JSON object"}), 400
+        user_id = form.get('userId')  # can be None
+
+        # JSON string from the form, or a list/dict in a JSON body
+        members = form.get('members')
+        if isinstance(members, (list, dict)):
+            members = json.dumps(members)
+        elif not isinstance(members, str) or not members:
+            return jsonify({"message": "Team members are required"}), 400
         # ----------------------------
         # Files
         # ----------------------------
-        print(request.files)
-        # Bonafide is mandatory
-        bonafide_file = request.files.get('bonafideFile')
-        if not bonafide_file:
-            return jsonify({"message": "Bonafide file is required"}), 400
-
-        bonafide_url = upload_to_cloudinary(bonafide_file, 'hackathon_bonafide')
-
-        # PPT is optional
-        ppt_file = request.files.get('pptFile')
-        if ppt_file:
-            ppt_url = upload_to_cloudinary(ppt_file, 'hackathon_ppt')
+        uploads = {}
+        if request.is_json:
+            bonafide_url = form.get('bonafideFileUrl')
+            ppt_url = form.get('pptFileUrl')
+            # Bonafide is mandatory, PPT is optional
+            if not is_cloudinary_url(bonafide_url):
+                return jsonify({"message": "Bonafide file is required"}), 400
+            if ppt_url and not is_cloudinary_url(ppt_url):
+                return jsonify({"message": "Invalid PPT file URL"}), 400
         else:
-            ppt_url = None
+            print(request.files)
+            # Bonafide is mandatory
+            bonafide_file = request.files.get('bonafideFile')
+            if not bonafide_file:
+                return jsonify({"message": "Bonafide file is required"}), 400
+
+            # Files are staged in Redis and pushed to Cloudinary by a worker
+            bonafide_url, ppt_url = PENDING_UPLOAD, None
+            uploads['bonafide_file'] = (stage_upload(bonafide_file), secure_filename(bonafide_file.filename), 'hackathon_bonafide')
+
+            # PPT is optional
+            ppt_file = request.files.get('pptFile')
+            if ppt_file:
+                uploads['ppt_file'] = (stage_upload(ppt_file), secure_filename(ppt_file.filename), 'hackathon_ppt')
 
         # ----------------------------
         # Create DB object
@@ -298,61 +741,70 @@ def hackathon_registration():
         new_registration = HackathonRegistration(
             user_id=user_id,
 
-            team_name=request.form.get('teamName'),
-            institution_name=request.form.get('institutionName'),
-            team_size=request.form.get('totalMembers'),
+            team_name=form.get('teamName'),
+            institution_name=form.get('institutionName'),
+            team_size=form.get('totalMembers'),
 
-            members=request.form.get('members'),  # JSON string
+            members=members,  # JSON string
 
-            problem_domain=request.form.get('problemDomain'),
-            project_title=request.form.get('projectTitle'),
-            github_repo_link=request.form.get('githubRepoLink'),
-            demo_video_url=request.form.get('demoVideoURL'),
+            problem_domain=form.get('problemDomain'),
+            project_title=form.get('projectTitle'),
+            github_repo_link=form.get('githubRepoLink'),
+            demo_video_url=form.get('demoVideoURL'),
 
             ppt_file=ppt_url,
             bonafide_file=bonafide_url,
 
-            agree_to_rules=request.form.get('agreeToRules') == "true"
+            agree_to_rules=form.get('agreeToRules') in (True, "true")
         )
 
         # ----------------------------
-        # Generate Registration ID
+        # Registration ID comes from hack_reg_seq
         # ----------------------------
         db.session.add(new_registration)
-        db.session.flush()  # gets ID without commit
+        db.session.flush()  # single INSERT ... RETURNING id, registration_id
 
-        new_registration.registration_id = f"HACK{str(new_registration.id).zfill(5)}"
+        # Read before commit expires the instance, saving a refresh SELECT
+        registration_pk = new_registration.id
+        registration_id = new_registration.registration_id
 
         db.session.commit()
 
+        if uploads:
+            upload_files_task.delay(registration_pk, uploads)
+
+        # Drop the cached "not registered" status for this user
+        if user_id:
+            cache.delete(f"status:{user_id}")
+
         # ----------------------------
         # Optional email
         # ----------------------------
         if user_id:
             user = User.query.get(user_id)
             if user:
-                msg = Message(
-                    'Hackathon Registration Confirmed',
-                    sender=app.config['MAIL_USERNAME'],
-                    recipients=[user.email]
-                )
-                msg.body = f"""
+                body = f"""
 Hello,
 
 Your Hackathon registration was successful.
 
-Your Registration ID: {new_registration.registration_id}
+Your Registration ID: {registration_id}
 
 Good luck!
 """
-                mail.send(msg)
+                send_email_task.delay(
+                    'Hackathon Registration Confirmed',
+                    [user.email],
+                    body,
+                    _MAIL_SENDER
+                )
 
         # ----------------------------
         # Success
         # ----------------------------
         return jsonify({
             "message": "Registration submitted successfully",
-            "regId": new_registration.registration_id
+            "regId": registration_id
         }), 201
 
     except Exception as e:
@@ -366,19 +818,82 @@ Good luck!
 
 @app.route('/api/admin/all-data', methods=['GET'])
 def get_admin_data():
+    # Keyset pagination: ?after_id=<last id seen>&limit=<page size, 1-500>.
+    # Without a limit every registration is streamed.
+    invalid_params = jsonify({"message": "after_id must be an integer and limit a positive integer"}), 400
     try:
-        # Fetch all records
-        ideas = HackathonRegistration.query.all()
+        after_id = int(request.args.get('after_id', 0))
+        limit = int(request.args['limit']) if 'limit' in request.args else None
+    except ValueError:
+        return invalid_params
+    if limit is not None and limit <= 0:
+        return invalid_params
+    if limit:
+        limit = min(limit, ADMIN_PAGE_MAX_SIZE)
 
-        user_count = User.query.count()
-        # Serialize them
-        return jsonify({
-            "hackathon_registration": [serialize_model(i) for i in ideas],
-            "totalUsers": user_count
-        }), 200
+    try:
+
+        registrations = HackathonRegistration.__table__
+
+        # One aggregate query that changes whenever the listing would: new
+        # users or registrations, or pending uploads being filled in
+        fingerprint = db.session.execute(select(
+            select(func.count()).select_from(User).scalar_subquery(),
+            func.count(registrations.c.id),
+            func.max(registrations.c.id),
+            func.max(registrations.c.submitted_at),
+            func.count(registrations.c.id).filter(registrations.c.bonafide_file == PENDING_UPLOAD)
+        )).one()
+        user_count = fingerprint[0]
+
+        etag = hashlib.md5(repr((tuple(fingerprint), after_id, limit)).encode()).hexdigest()
+        if request.if_none_match.contains(etag):
+            response = app.response_class(status=304)
+            response.set_etag(etag)
+            return response
+
+        # Core select on the table: plain rows, no ORM objects or identity map
+        query = (
+            select(registrations)
+            .where(registrations.c.id > after_id)
+            .order_by(registrations.c.id)
+            .execution_options(yield_per=ADMIN_STREAM_BATCH_SIZE)
+        )
+        if limit:
+            query = query.limit(limit)
+
+        # Own connection rather than db.session: the session is removed at
+        # app-context teardown, before the response body is streamed. Fetching
+        # the first batch here means query errors still map to a 500.
+        conn = db.engine.connect()
+        try:
+            batches = conn.execute(query).partitions()
+            first_batch = next(batches, None)
+        except Exception:
+            conn.close()
+            raise
     except Exception as e:
         return jsonify({"message": "Failed to fetch admin data", "error": str(e)}), 500
 
+    def generate():
+        # Same JSON document as before, written out one DB batch at a time
+        yield b'{"totalUsers":' + app.json.dumpb(user_count) + b',"hackathon_registration":['
+        separator = b''
+        sent, last_id = 0, None
+        for batch in itertools.chain([first_batch] if first_batch else [], batches):
+            yield separator + b','.join(app.json.dumpb(serialize_model(row)) for row in batch)
+            separator = b','
+            sent += len(batch)
+            last_id = batch[-1].id
+        next_after_id = last_id if limit and sent == limit else None
+        yield b'],"nextAfterId":' + app.json.dumpb(next_after_id) + b'}'
+
+    response = app.response_class(stream_with_context(generate()), mimetype='application/json')
+    # Released when the server closes the response, even if the body is never read (HEAD)
+    response.call_on_close(conn.close)
+    response.set_etag(etag)
+    return response, 200
+
 if __name__ == '__main__':
     with app.app_context():
         db.create_all()
@@ -0,0 +1,19 @@
+import multiprocessing
+import os
+
+# Gevent workers: requests waiting on SMTP, Cloudinary or the DB yield to
+# other greenlets instead of holding the whole worker.
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+worker_class = "gevent"
+# Each worker opens up to DB_POOL_SIZE + DB_MAX_OVERFLOW (5 + 5 by default)
+# Postgres connections; keep workers * that under max_connections (100).
+workers = int(os.getenv("WEB_CONCURRENCY", multiprocessing.cpu_count()))
+worker_connections = 1000
+timeout = 120
+
+
+def post_fork(server, worker):
+    # psycopg2 is a C extension, so gevent's monkey patching can't reach it;
+    # this makes its queries wait on the gevent hub as well.
+    from psycogreen.gevent import patch_psycopg
+    patch_psycopg()
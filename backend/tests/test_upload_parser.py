@@ -0,0 +1,34 @@
+import io
+import os
+
+import pytest
+from flask import Flask, request
+
+from upload_parser import LargeUploadRequest
+
+
+@pytest.fixture
+def client():
+    app = Flask(__name__)
+    app.request_class = LargeUploadRequest
+    app.config['MAX_FORM_MEMORY_SIZE'] = 2 * 1024 * 1024
+
+    @app.route('/upload', methods=['POST'])
+    def upload():
+        data = request.files['bonafideFile'].read()
+        return {'size': len(data), 'teamName': request.form['teamName']}
+
+    return app.test_client()
+
+
+@pytest.mark.parametrize('size_mb', [10, 30])
+def test_large_incompressible_upload_is_accepted(client, size_mb):
+    # Random bytes behave like real PDF/PPTX files (already compressed)
+    payload = os.urandom(size_mb * 1024 * 1024)
+    response = client.post('/upload', data={
+        'teamName': 'team',
+        'bonafideFile': (io.BytesIO(payload), 'bonafide.pdf'),
+    })
+
+    assert response.status_code == 200
+    assert response.json == {'size': len(payload), 'teamName': 'team'}
@@ -0,0 +1,37 @@
+from flask import Request
+from werkzeug.formparser import FormDataParser, MultiPartParser
+
+
+class LargeUploadFormDataParser(FormDataParser):
+    """Parses multipart bodies with a larger read buffer than Werkzeug's 64KB.
+
+    A bigger buffer means far fewer boundary scans over the same bytes when
+    parsing the large PPT/bonafide uploads. Werkzeug answers 413 whenever the
+    bytes it still holds plus a new read exceed max_form_memory_size, so reads
+    are kept to half of that limit (1MB with the app's 2MB), and never more
+    than buffer_size.
+    """
+    buffer_size = 16 * 1024 * 1024
+
+    def _parse_multipart(self, stream, mimetype, content_length, options):
+        buffer_size = self.buffer_size
+        if self.max_form_memory_size is not None:
+            buffer_size = min(buffer_size, self.max_form_memory_size // 2)
+
+        parser = MultiPartParser(
+            stream_factory=self.stream_factory,
+            max_form_memory_size=self.max_form_memory_size,
+            max_form_parts=self.max_form_parts,
+            buffer_size=buffer_size,
+            cls=self.cls,
+        )
+        boundary = options.get("boundary", "").encode("ascii")
+
+        if not boundary:
+            raise ValueError("Missing boundary")
+
+        form, files = parser.parse(stream, boundary, content_length)
+        return stream, form, files
+
+class LargeUploadRequest(Request):
+    form_data_parser_class = LargeUploadFormDataParser
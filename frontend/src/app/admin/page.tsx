@@ -22,8 +22,9 @@ interface hackathon_registration {
   problem_domain: string
   agree_to_rules: boolean
 
-  bonafide_file: string
-  ppt_file: string
+  // Cloudinary URL, or 'pending' / 'failed' while the background upload runs
+  bonafide_file: string | null
+  ppt_file: string | null
   demo_video_url: string
   github_repo_link: string
 
@@ -37,6 +38,25 @@ interface ApiResponse {
   totalUsers: number
 }
 
+/* ================= COMPONENTS ================= */
+
+function FileLink({ url, label }: { url: string | null; label: string }) {
+  if (!url) {
+    return null
+  }
+  if (url === 'pending') {
+    return <span className='text-gray-500 no-underline'>{label} (uploading)</span>
+  }
+  if (url === 'failed') {
+    return <span className='text-red-600 no-underline'>{label} (upload failed)</span>
+  }
+  return (
+    <a href={url} target='_blank'>
+      {label}
+    </a>
+  )
+}
+
 /* ================= PAGE ================= */
 
 export default async function Page() {
@@ -95,12 +115,8 @@ export default async function Page() {
             </div>
 
             <div className='flex gap-4 text-sm text-blue-600 underline'>
-              <a href={item.ppt_file} target='_blank'>
-                PPT
-              </a>
-              <a href={item.bonafide_file} target='_blank'>
-                Bonafide
-              </a>
+              <FileLink url={item.ppt_file} label='PPT' />
+              <FileLink url={item.bonafide_file} label='Bonafide' />
               <a href={item.github_repo_link} target='_blank'>
                 GitHub
               </a>